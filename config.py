@@ -3,6 +3,8 @@ NERV Dashboard Configuration
 活動限界 - Configuration Parameters
 """
 
+import os
+
 # Display settings
 DISPLAY_WIDTH = 600
 DISPLAY_HEIGHT = 448
@@ -40,6 +42,12 @@ THEME = {
 # Update interval (seconds)
 UPDATE_INTERVAL = 300  # 5 minutes
 
+# On-disk cache for data that survives restarts (Earth View list, etc.)
+CACHE_DIR = os.path.expanduser("~/.cache/nerv")
+EARTHVIEW_CACHE_DAYS = 7
+SATELLITE_CACHE_MAX_IMAGES = 200  # Resized satellite images kept on disk
+SATELLITE_PREFETCH = 4  # Upcoming satellite images downloaded in parallel
+
 # Pages configuration
 PAGES = ["dashboard", "todos", "satellite", "experimental"]
 DEFAULT_PAGE = "dashboard"
@@ -69,6 +77,10 @@ CALENDAR_CACHE_MINUTES = 15
 # 4. Copy the database ID from the URL
 NOTION_API_KEY = ""
 NOTION_DATABASE_ID = ""
+NOTION_TTL_SECONDS = 300  # Re-fetch todos after 5 minutes (Notion allows ~3 req/s)
+NOTION_FIRST_FETCH_WAIT = 15  # Seconds to wait for a cold-start or forced todos fetch
+NOTION_FAILURES_BEFORE_PAUSE = 3  # Consecutive failed fetches before backing off
+NOTION_MAX_PAUSE_SECONDS = 1800  # Longest back-off after repeated failures (30 minutes)
 
 # Japanese labels
 LABELS = {
@@ -3,8 +3,28 @@ Notion Integration
 Fetches todos from a Notion database
 """
 
+import time
 import requests
-from datetime import datetime, date
+from urllib.parse import unquote
+from requests.adapters import HTTPAdapter
+from datetime import datetime, date, timedelta, timezone
+
+# One keep-alive session shared by every client, created on first use
+_session = None
+
+
+def get_session():
+    """Return the shared Notion HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return _session
+
+
+# Property IDs per database, looked up once for filter_properties
+_property_ids = {}
 
 
 class NotionClient:
@@ -12,10 +32,16 @@ class NotionClient:
 
     BASE_URL = "https://api.notion.com/v1"
     NOTION_VERSION = "2022-06-28"
+    MAX_RETRIES = 3  # Retries on HTTP 429 (rate limited)
+    PROPERTIES = ("Name", "Status", "Due date", "Tag")  # The only properties fetch_todos parses
+    # Status is a "status" type with options: "Done", "Not done", "Missed"
+    OPEN_FILTER = {"property": "Status", "status": {"does_not_equal": "Done"}}
 
-    def __init__(self, api_key, database_id):
+    def __init__(self, api_key, database_id, session=None):
         self.api_key = api_key
         self.database_id = database_id
+        self.session = session or get_session()
+        self.fingerprint = None  # Open pages seen by the last fetch_todos (see _fingerprint)
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
@@ -43,6 +69,37 @@ class NotionClient:
                     return None
         return None
 
+    def _property_ids(self):
+        """IDs of PROPERTIES in this database, or None if the schema can't be read."""
+        ids = _property_ids.get(self.database_id)
+        if ids is None:
+            url = f"{self.BASE_URL}/databases/{self.database_id}"
+            try:
+                response = self.session.get(url, headers=self.headers, timeout=10)
+                response.raise_for_status()
+                props = response.json().get("properties", {})
+            except (requests.RequestException, ValueError) as e:
+                print(f"Notion schema lookup failed, fetching all properties: {e}")
+                return None
+            # IDs come back URL-encoded; requests encodes query params itself
+            ids = [unquote(props[name]["id"]) for name in self.PROPERTIES if name in props]
+            _property_ids[self.database_id] = ids
+        return ids
+
+    def _post_with_backoff(self, url, payload, params=None):
+        """POST to Notion, backing off exponentially while rate limited."""
+        for attempt in range(self.MAX_RETRIES + 1):
+            response = self.session.post(url, headers=self.headers, json=payload,
+                                         params=params, timeout=10)
+            if response.status_code != 429 or attempt == self.MAX_RETRIES:
+                break
+            # Honour Retry-After when Notion sends it, else 1s, 2s, 4s...
+            delay = float(response.headers.get("Retry-After", 2 ** attempt))
+            print(f"Notion rate limited, retrying in {delay:.0f}s")
+            time.sleep(delay)
+        response.raise_for_status()
+        return response
+
     def fetch_todos(self, include_done=False):
         """
         Fetch todos from Notion database.
@@ -60,20 +117,17 @@ class NotionClient:
         }
 
         # Filter out done items if requested
-        # Status is a "status" type with options: "Done", "Not done", "Missed"
         if not include_done:
-            payload["filter"] = {
-                "property": "Status",
-                "status": {"does_not_equal": "Done"}
-            }
+            payload["filter"] = self.OPEN_FILTER
 
-        try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-        except requests.RequestException as e:
-            print(f"Notion API error: {e}")
-            return []
+        # Only ask for the properties we parse, to keep the response small
+        ids = self._property_ids()
+        params = {"filter_properties": ids} if ids else None
+
+        # Errors propagate so callers can tell a failed fetch from an empty list
+        response = self._post_with_backoff(url, payload, params)
+        data = response.json()
+        self.fingerprint = None if include_done else self._fingerprint(data)
 
         todos = []
         today_date = date.today()
@@ -127,6 +181,41 @@ class NotionClient:
 
         return todos
 
+    def _fingerprint(self, data):
+        """
+        Identify the pages in a query response by (id, last_edited_time).
+
+        Adding, editing, completing or deleting a todo all change the set.
+        Notion rounds last_edited_time down to the minute, so a page edited in
+        the last couple of minutes could change again without its timestamp
+        moving; returns None then, and for paginated results, so the caller
+        falls back to a full fetch.
+        """
+        if data.get("has_more"):
+            return None
+        recent = datetime.now(timezone.utc) - timedelta(minutes=2)
+        pages = set()
+        for result in data.get("results", []):
+            edited = result.get("last_edited_time", "")
+            try:
+                if datetime.fromisoformat(edited.replace("Z", "+00:00")) >= recent:
+                    return None
+            except ValueError:
+                return None
+            pages.add((result.get("id"), edited))
+        return frozenset(pages)
+
+    def open_pages_fingerprint(self):
+        """Fingerprint the not-done pages with a title-only query (None if it fails)."""
+        url = f"{self.BASE_URL}/databases/{self.database_id}/query"
+        payload = {"filter": self.OPEN_FILTER}
+        try:
+            response = self._post_with_backoff(url, payload, {"filter_properties": ["title"]})
+            return self._fingerprint(response.json())
+        except (requests.RequestException, ValueError) as e:
+            print(f"Notion change check failed: {e}")
+            return None
+
     def get_todos_for_display(self):
         """
         Get todos formatted for display on the dashboard.
@@ -169,17 +258,26 @@ class NotionClient:
         return display_todos
 
 
-def get_notion_todos():
-    """Fetch todos using credentials from secrets.py."""
+def get_notion_todos(session=None, known=None):
+    """
+    Fetch todos using credentials from secrets.py.
+
+    Returns (todos, fingerprint). Pass the fingerprint from a previous call
+    as known to skip the full fetch when the open pages are unchanged; todos
+    is then None.
+    """
     try:
         from secrets import NOTION_API_KEY, NOTION_DATABASE_ID
     except ImportError:
         print("No secrets.py found - Notion integration disabled")
-        return []
+        return [], None
 
     if not NOTION_API_KEY or not NOTION_DATABASE_ID:
         print("Notion credentials not configured in secrets.py")
-        return []
+        return [], None
 
-    client = NotionClient(NOTION_API_KEY, NOTION_DATABASE_ID)
-    return client.get_todos_for_display()
+    client = NotionClient(NOTION_API_KEY, NOTION_DATABASE_ID, session=session)
+    if known is not None and client.open_pages_fingerprint() == known:
+        return None, known
+    todos = client.get_todos_for_display()
+    return todos, client.fingerprint
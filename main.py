@@ -161,6 +161,12 @@ class NERVDashboard:
         self.current_page = self.page_order[self.current_page_index]
         print(f"Switched to page: {self.current_page}")
 
+    def force_refresh(self):
+        """Have the current page re-fetch its data, if it supports that (button D)."""
+        page = self.pages[self.current_page]
+        if hasattr(page, "force_refresh"):
+            page.force_refresh()
+
     def handle_special_action(self):
         """Handle page-specific special action (button C)."""
         # For now, just print - can be extended per page
@@ -209,6 +215,7 @@ class NERVDashboard:
                     action = self.check_buttons()
 
                     if action == "refresh":
+                        self.force_refresh()
                         self.update_display()
                         break
                     elif action == "next":
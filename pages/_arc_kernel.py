@@ -0,0 +1,89 @@
+"""
+Daylight arc kernel
+Computes the height of the sun arc at any time of day and for every pixel column
+"""
+
+import math
+
+# Try to import numpy/numba, fall back to plain Python if not available
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def sun_height(seconds, arc_height, sunrise_sec, sunset_sec):
+    """Height of the sun above the horizon, in pixels, at seconds since midnight."""
+    if sunrise_sec <= seconds <= sunset_sec:
+        day_progress = (seconds - sunrise_sec) / (sunset_sec - sunrise_sec)
+        return arc_height // 2 * math.sin(day_progress * math.pi)
+    elif seconds < sunrise_sec:
+        night_progress = seconds / sunrise_sec
+        return -arc_height // 4 * math.cos(night_progress * math.pi / 2)
+    else:
+        night_progress = (seconds - sunset_sec) / (86400 - sunset_sec)
+        return -arc_height // 4 * math.sin(night_progress * math.pi / 2)
+
+
+def _arc_ys_py(width, arc_height, sunrise_sec, sunset_sec, horizon_y):
+    """Pure-Python arc evaluation, used when numpy is not installed."""
+    # Same maths as sun_height, with everything the loop touches bound to locals
+    sin, cos, pi = math.sin, math.cos, math.pi
+    amp_day = arc_height // 2
+    amp_night = -arc_height // 4
+    day_span_sec = sunset_sec - sunrise_sec
+    post_span_sec = 86400 - sunset_sec
+
+    ys = []
+    append = ys.append
+    for i in range(width + 1):
+        seconds = i * 86400 // width
+        if sunrise_sec <= seconds <= sunset_sec:
+            sun_h = amp_day * sin((seconds - sunrise_sec) / day_span_sec * pi)
+        elif seconds < sunrise_sec:
+            sun_h = amp_night * cos(seconds / sunrise_sec * pi / 2)
+        else:
+            sun_h = amp_night * sin((seconds - sunset_sec) / post_span_sec * pi / 2)
+        append(horizon_y - int(sun_h))
+    return ys
+
+
+def _arc_ys_np(width, arc_height, sunrise_sec, sunset_sec, horizon_y):
+    """Vectorized arc evaluation, used when numpy is installed without numba."""
+    seconds = np.arange(width + 1) * 86400 // width
+    # Columns are sorted by time, so each regime is one contiguous slice
+    i_sr = np.searchsorted(seconds, sunrise_sec, side="left")
+    i_ss = np.searchsorted(seconds, sunset_sec, side="right")
+
+    sun_h = np.empty(width + 1)
+    pre, day, post = seconds[:i_sr], seconds[i_sr:i_ss], seconds[i_ss:]
+    sun_h[:i_sr] = -arc_height // 4 * np.cos(pre / sunrise_sec * np.pi / 2)
+    sun_h[i_sr:i_ss] = arc_height // 2 * np.sin((day - sunrise_sec) / (sunset_sec - sunrise_sec) * np.pi)
+    sun_h[i_ss:] = -arc_height // 4 * np.sin((post - sunset_sec) / (86400 - sunset_sec) * np.pi / 2)
+    return (horizon_y - sun_h.astype(np.int32)).tolist()
+
+
+if NUMBA_AVAILABLE:
+    sun_height = njit(cache=True, fastmath=True)(sun_height)
+
+    @njit(cache=True, fastmath=True)
+    def _arc_ys_jit(width, arc_height, sunrise_sec, sunset_sec, horizon_y):
+        """Same evaluation as _arc_ys_py, compiled to a native loop."""
+        out = np.empty(width + 1, np.int32)
+        for i in range(width + 1):
+            out[i] = horizon_y - int(sun_height(i * 86400 // width, arc_height,
+                                                sunrise_sec, sunset_sec))
+        return out
+
+    arc_ys = _arc_ys_jit
+elif NUMPY_AVAILABLE:
+    arc_ys = _arc_ys_np
+else:
+    arc_ys = _arc_ys_py
@@ -21,6 +21,15 @@ class Page:
         self.fonts = fonts
         self.colors = config.COLORS
         self.theme = config.THEME
+        self._resolve_colors()
+
+    def _resolve_colors(self):
+        """Cache theme colors used on every frame. Call again if the theme changes."""
+        self._c_primary = self._get_color("primary")
+        self._c_secondary = self._get_color("secondary")
+        self._c_accent = self._get_color("accent")
+        self._c_warning = self._get_color("warning")
+        self._c_success = self._get_color("success")
 
     def _get_color(self, name):
         """Get RGB color tuple from theme name."""
@@ -29,7 +38,7 @@ class Page:
 
     def draw_hazard_stripes(self, draw, x, y, width, height, stripe_width=10):
         """Draw diagonal hazard stripes (yellow/black)."""
-        yellow = self._get_color("warning")
+        yellow = self._c_warning
         black = self.colors["black"]
 
         draw.rectangle([x, y, x + width, y + height], fill=yellow)
@@ -45,7 +54,7 @@ class Page:
 
     def draw_border_frame(self, draw, x, y, width, height, thickness=2):
         """Draw NERV-style technical border with corner accents."""
-        color = self._get_color("primary")
+        color = self._c_primary
 
         draw.rectangle(
             [x, y, x + width, y + height],
@@ -70,11 +79,11 @@ class Page:
         """Draw NERV-style header with page indicator."""
         # NERV logo
         draw.text((15, 8), "NERV", font=self.fonts["medium"],
-                  fill=self._get_color("accent"))
+                  fill=self._c_accent)
 
         # Page title
         draw.text((85, 12), self.title, font=self.fonts["small"],
-                  fill=self._get_color("primary"))
+                  fill=self._c_primary)
 
         # Page indicator dots (right side)
         dot_radius = 4
@@ -89,12 +98,12 @@ class Page:
                 # Current page - filled
                 draw.ellipse([cx - dot_radius, cy - dot_radius,
                              cx + dot_radius, cy + dot_radius],
-                            fill=self._get_color("primary"))
+                            fill=self._c_primary)
             else:
                 # Other pages - outline only
                 draw.ellipse([cx - dot_radius, cy - dot_radius,
                              cx + dot_radius, cy + dot_radius],
-                            outline=self._get_color("primary"), width=1)
+                            outline=self._c_primary, width=1)
 
     def draw_footer(self, draw):
         """Draw footer (placeholder, no hazard stripes)."""
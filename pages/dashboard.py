@@ -3,15 +3,32 @@ Dashboard Page - Main display
 Time, date, daylight arc, upcoming events
 """
 
-import math
+from collections import defaultdict
 from datetime import datetime, timedelta
-from PIL import ImageDraw
+from functools import lru_cache
+from PIL import ImageDraw, ImagePath
 
 from astral import LocationInfo
 from astral.sun import sun
 
 import config
 from pages.base import Page
+from pages._arc_kernel import arc_ys, sun_height
+
+# Segments lit for each character of the 7-segment clock
+DIGIT_SEGMENTS = {
+    '0': ('top', 'tr', 'br', 'bottom', 'bl', 'tl'),
+    '1': ('tr', 'br'),
+    '2': ('top', 'tr', 'mid', 'bl', 'bottom'),
+    '3': ('top', 'tr', 'mid', 'br', 'bottom'),
+    '4': ('tl', 'mid', 'tr', 'br'),
+    '5': ('top', 'tl', 'mid', 'br', 'bottom'),
+    '6': ('top', 'tl', 'mid', 'bl', 'br', 'bottom'),
+    '7': ('top', 'tr', 'br'),
+    '8': ('top', 'tr', 'br', 'bottom', 'bl', 'tl', 'mid'),
+    '9': ('top', 'tr', 'br', 'bottom', 'tl', 'mid'),
+    ':': (),
+}
 
 
 class DashboardPage(Page):
@@ -36,8 +53,17 @@ class DashboardPage(Page):
 
         # Calendar events
         self.events = []
+        self.event_groups = []
         self._last_fetch = None
 
+        # Last rendered frame and the state it was rendered from
+        self._last_state = None
+        self._last_image = None
+
+        # Sun times and arc polyline only change once a day
+        self._sun_cache = (None, None)
+        self._arc_cache = (None, None)
+
     def refresh_events(self):
         """Fetch fresh calendar events."""
         try:
@@ -48,39 +74,58 @@ class DashboardPage(Page):
         except Exception as e:
             print(f"Error fetching calendar events: {e}")
             self.events = []
+        self._group_events()
+        self._last_image = None
 
-    def draw_segmented_digit(self, draw, x, y, digit, size=80, thickness=10):
-        """Draw a single 7-segment style digit."""
-        color = self._get_color("primary")
+    def _group_events(self):
+        """Group events by date and pre-format everything draw_events needs."""
+        events_by_date = defaultdict(list)
+        headers = {}
+        primary = self._c_primary
+        for event in self.events:
+            event_date = event.get("start")
+            if not event_date:
+                continue
+            date_key = event_date.strftime("%Y-%m-%d")
+            if date_key not in headers:
+                headers[date_key] = event_date.strftime("%A %m.%d").upper()  # "THURSDAY 11.27"
+            events_by_date[date_key].append((
+                event.get("symbol", "●"),
+                event.get("time", "").upper(),
+                event.get("title", "Untitled"),
+                self.colors.get(event.get("color", "primary"), primary),
+            ))
+
+        self.event_groups = [(date_key, headers[date_key], events_by_date[date_key])
+                             for date_key in sorted(events_by_date)]
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _segment_polys(size, thickness):
+        """Segment polygons for a digit of the given size, relative to its top-left."""
         w = size // 2
         h = size
         t = thickness
         gap = 2
 
-        segments = {
-            'top':    [(gap, 0), (w - gap, 0), (w - gap - t//2, t), (gap + t//2, t)],
-            'tr':     [(w - t, gap), (w, gap), (w, h//2 - gap), (w - t, h//2 - gap - t//2)],
-            'br':     [(w - t, h//2 + gap + t//2), (w, h//2 + gap), (w, h - gap), (w - t, h - gap)],
-            'bottom': [(gap + t//2, h - t), (w - gap - t//2, h - t), (w - gap, h), (gap, h)],
-            'bl':     [(0, h//2 + gap), (t, h//2 + gap + t//2), (t, h - gap), (0, h - gap)],
-            'tl':     [(0, gap), (t, gap), (t, h//2 - gap - t//2), (0, h//2 - gap)],
-            'mid':    [(gap + t//2, h//2 - t//2), (w - gap - t//2, h//2 - t//2),
-                       (w - gap - t//2, h//2 + t//2), (gap + t//2, h//2 + t//2)],
+        return {
+            'top':    ((gap, 0), (w - gap, 0), (w - gap - t//2, t), (gap + t//2, t)),
+            'tr':     ((w - t, gap), (w, gap), (w, h//2 - gap), (w - t, h//2 - gap - t//2)),
+            'br':     ((w - t, h//2 + gap + t//2), (w, h//2 + gap), (w, h - gap), (w - t, h - gap)),
+            'bottom': ((gap + t//2, h - t), (w - gap - t//2, h - t), (w - gap, h), (gap, h)),
+            'bl':     ((0, h//2 + gap), (t, h//2 + gap + t//2), (t, h - gap), (0, h - gap)),
+            'tl':     ((0, gap), (t, gap), (t, h//2 - gap - t//2), (0, h//2 - gap)),
+            'mid':    ((gap + t//2, h//2 - t//2), (w - gap - t//2, h//2 - t//2),
+                       (w - gap - t//2, h//2 + t//2), (gap + t//2, h//2 + t//2)),
         }
 
-        digit_segments = {
-            '0': ['top', 'tr', 'br', 'bottom', 'bl', 'tl'],
-            '1': ['tr', 'br'],
-            '2': ['top', 'tr', 'mid', 'bl', 'bottom'],
-            '3': ['top', 'tr', 'mid', 'br', 'bottom'],
-            '4': ['tl', 'mid', 'tr', 'br'],
-            '5': ['top', 'tl', 'mid', 'br', 'bottom'],
-            '6': ['top', 'tl', 'mid', 'bl', 'br', 'bottom'],
-            '7': ['top', 'tr', 'br'],
-            '8': ['top', 'tr', 'br', 'bottom', 'bl', 'tl', 'mid'],
-            '9': ['top', 'tr', 'br', 'bottom', 'tl', 'mid'],
-            ':': [],
-        }
+    def draw_segmented_digit(self, draw, x, y, digit, size=80, thickness=10, color=None):
+        """Draw a single 7-segment style digit."""
+        if color is None:
+            color = self._c_primary
+        w = size // 2
+        h = size
+        t = thickness
 
         if digit == ':':
             dot_size = t
@@ -90,8 +135,8 @@ class DashboardPage(Page):
                          x + w//4 + dot_size, y + 2*h//3 + dot_size//2], fill=color)
             return w//2 + 8
 
-        active = digit_segments.get(str(digit), [])
-        for seg_name in active:
+        segments = self._segment_polys(size, thickness)
+        for seg_name in DIGIT_SEGMENTS.get(str(digit), ()):
             points = [(x + px, y + py) for px, py in segments[seg_name]]
             draw.polygon(points, fill=color)
 
@@ -114,12 +159,14 @@ class DashboardPage(Page):
         label_bbox = draw.textbbox((0, 0), config.LABELS["time"], font=self.fonts["jp"])
         label_width = label_bbox[2] - label_bbox[0]
         draw.text((x + (box_width - label_width) // 2, y - 22), config.LABELS["time"],
-                  font=self.fonts["jp"], fill=self._get_color("secondary"))
+                  font=self.fonts["jp"], fill=self._c_secondary)
 
         # Draw segmented digits (larger size)
+        primary = self._c_primary
         offset_x = start_x
         for char in time_str:
-            width = self.draw_segmented_digit(draw, offset_x, y, char, size=90, thickness=12)
+            width = self.draw_segmented_digit(draw, offset_x, y, char, size=90, thickness=12,
+                                              color=primary)
             offset_x += width
 
         # Return the left edge of time for date alignment
@@ -139,19 +186,19 @@ class DashboardPage(Page):
         date_x = x + (box_width - date_width) // 2
 
         draw.text((date_x, y), date_str,
-                  font=self.fonts["medium"], fill=self._get_color("primary"))
+                  font=self.fonts["medium"], fill=self._c_primary)
 
         # Day of week after date
         date_only_bbox = draw.textbbox((0, 0), date_str + " ", font=self.fonts["medium"])
         day_x = date_x + date_only_bbox[2] - date_only_bbox[0]
         draw.text((day_x, y), day_str,
-                  font=self.fonts["medium"], fill=self._get_color("accent"))
+                  font=self.fonts["medium"], fill=self._c_accent)
 
     def draw_placeholder_module(self, draw, x, y, width, height):
         """Draw placeholder for future module (word of day, verse, etc.)."""
         # Header
         draw.text((x, y), "モジュール / MODULE",
-                  font=self.fonts["small"], fill=self._get_color("accent"))
+                  font=self.fonts["small"], fill=self._c_accent)
 
         # Centered N/A placeholder
         na_text = "N/A"
@@ -163,84 +210,90 @@ class DashboardPage(Page):
         na_y = y + (height - na_height) // 2
 
         draw.text((na_x, na_y), na_text,
-                 font=self.fonts["medium"], fill=self._get_color("secondary"))
+                 font=self.fonts["medium"], fill=self._c_secondary)
+
+    def _sun_times(self, d):
+        """Sunrise/sunset for a date, pre-digested for draw_daylight_arc."""
+        s = sun(self.location.observer, date=d, tzinfo=self.location.timezone)
+        sunrise = s["sunrise"]
+        sunset = s["sunset"]
+
+        # Whole seconds since local midnight; pixel columns follow as
+        # seconds * width // 86400 without any float round-trips. sun() already
+        # returns times in the location's timezone, so the wall-clock fields
+        # can be read directly.
+        return {
+            "sunrise": sunrise,
+            "sunset": sunset,
+            "sunrise_sec": sunrise.hour * 3600 + sunrise.minute * 60 + sunrise.second,
+            "sunset_sec": sunset.hour * 3600 + sunset.minute * 60 + sunset.second,
+            "sunrise_str": sunrise.strftime("%H:%M"),
+            "sunset_str": sunset.strftime("%H:%M"),
+        }
 
     def draw_daylight_arc(self, draw, x, y, width, height, current_time):
         """Draw 24-hour sun arc with S-curves for night, no box."""
-        try:
-            s = sun(self.location.observer, date=current_time.date(),
-                   tzinfo=self.location.timezone)
-            sunrise = s["sunrise"]
-            sunset = s["sunset"]
-        except Exception as e:
-            draw.text((x, y), f"Sun calc error: {e}",
-                     font=self.fonts["small"], fill=self._get_color("accent"))
-            return
+        if current_time.tzinfo:
+            current_time = current_time.astimezone(self.location.tzinfo).replace(tzinfo=None)
+
+        primary = self._c_primary
+        secondary = self._c_secondary
+        accent = self._c_accent
+        warning = self._c_warning
+
+        d = current_time.date()
+        if self._sun_cache[0] != d:
+            try:
+                self._sun_cache = (d, self._sun_times(d))
+            except Exception as e:
+                draw.text((x, y), f"Sun calc error: {e}",
+                         font=self.fonts["small"], fill=accent)
+                return
+        sun_times = self._sun_cache[1]
+        sunrise_sec = sun_times["sunrise_sec"]
+        sunset_sec = sun_times["sunset_sec"]
 
         arc_y = y
         arc_height = height - 25
-
-        # Time calculations
-        midnight = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-        sunrise_naive = sunrise.replace(tzinfo=None)
-        sunset_naive = sunset.replace(tzinfo=None)
-        midnight_naive = midnight.replace(tzinfo=None) if midnight.tzinfo else midnight
-        current_naive = current_time.replace(tzinfo=None) if current_time.tzinfo else current_time
-
-        sunrise_frac = (sunrise_naive - midnight_naive).total_seconds() / 86400
-        sunset_frac = (sunset_naive - midnight_naive).total_seconds() / 86400
         horizon_y = arc_y + arc_height // 2
 
-        def get_sun_height(time_frac):
-            if sunrise_frac <= time_frac <= sunset_frac:
-                day_progress = (time_frac - sunrise_frac) / (sunset_frac - sunrise_frac)
-                return arc_height // 2 * math.sin(day_progress * math.pi)
-            elif time_frac < sunrise_frac:
-                night_progress = time_frac / sunrise_frac
-                return -arc_height // 4 * math.cos(night_progress * math.pi / 2)
-            else:
-                night_progress = (time_frac - sunset_frac) / (1 - sunset_frac)
-                return -arc_height // 4 * math.sin(night_progress * math.pi / 2)
-
         # Draw arc path
-        arc_color = self._get_color("secondary")
-        prev_point = None
-        for i in range(width + 1):
-            time_frac = i / width
-            sun_h = get_sun_height(time_frac)
-            point = (x + i, horizon_y - sun_h)
-            if prev_point:
-                draw.line([prev_point, point], fill=arc_color, width=2)
-            prev_point = point
+        arc_color = secondary
+        arc_key = (d, x, y, width, height)
+        if self._arc_cache[0] != arc_key:
+            ys = arc_ys(width, arc_height, sunrise_sec, sunset_sec, horizon_y)
+            coords = [0] * (2 * (width + 1))
+            coords[0::2] = range(x, x + width + 1)
+            coords[1::2] = ys
+            self._arc_cache = (arc_key, ImagePath.Path(coords))
+        draw.line(self._arc_cache[1], fill=arc_color, width=2)
 
         # Horizon line
         draw.line([(x, horizon_y), (x + width, horizon_y)],
-                 fill=self._get_color("primary"), width=1)
+                 fill=primary, width=1)
 
         # Sunrise line and label
-        sunrise_x = x + int(sunrise_frac * width)
+        sunrise_x = x + sunrise_sec * width // 86400
         draw.line([(sunrise_x, arc_y), (sunrise_x, horizon_y + 15)],
-                 fill=self._get_color("warning"), width=1)
-        sunrise_str = sunrise.strftime("%H:%M")
-        draw.text((sunrise_x - 15, arc_y - 15), sunrise_str,
-                  font=self.fonts["small"], fill=self._get_color("warning"))
+                 fill=warning, width=1)
+        draw.text((sunrise_x - 15, arc_y - 15), sun_times["sunrise_str"],
+                  font=self.fonts["small"], fill=warning)
 
         # Sunset line and label
-        sunset_x = x + int(sunset_frac * width)
+        sunset_x = x + sunset_sec * width // 86400
         draw.line([(sunset_x, arc_y), (sunset_x, horizon_y + 15)],
-                 fill=self._get_color("accent"), width=1)
-        sunset_str = sunset.strftime("%H:%M")
-        draw.text((sunset_x - 15, arc_y - 15), sunset_str,
-                  font=self.fonts["small"], fill=self._get_color("accent"))
+                 fill=accent, width=1)
+        draw.text((sunset_x - 15, arc_y - 15), sun_times["sunset_str"],
+                  font=self.fonts["small"], fill=accent)
 
         # Current sun position
-        now_frac = (current_naive - midnight_naive).total_seconds() / 86400
-        sun_h = get_sun_height(now_frac)
-        sun_x = x + int(now_frac * width)
+        now_sec = current_time.hour * 3600 + current_time.minute * 60 + current_time.second
+        sun_h = sun_height(now_sec, arc_height, sunrise_sec, sunset_sec)
+        sun_x = x + now_sec * width // 86400
         sun_y = int(horizon_y - sun_h)
 
-        is_day = sunrise_frac <= now_frac <= sunset_frac
-        sun_color = self._get_color("warning") if is_day else self._get_color("accent")
+        is_day = sunrise_sec <= now_sec <= sunset_sec
+        sun_color = warning if is_day else accent
         sun_radius = 7
         draw.ellipse([sun_x - sun_radius, sun_y - sun_radius,
                      sun_x + sun_radius, sun_y + sun_radius],
@@ -248,8 +301,13 @@ class DashboardPage(Page):
 
     def draw_events(self, draw, x, y, width, height):
         """Draw upcoming calendar events grouped by day with date headers."""
+        primary = self._c_primary
+        secondary = self._c_secondary
+        accent = self._c_accent
+        warning = self._c_warning
+
         draw.text((x, y), "予定 / UPCOMING",
-                  font=self.fonts["small"], fill=self._get_color("accent"))
+                  font=self.fonts["small"], fill=accent)
 
         event_y = y + 20
         line_height = 16
@@ -257,79 +315,64 @@ class DashboardPage(Page):
         padding = 8
         max_y = y + height - padding
 
-        if not self.events:
+        if not self.event_groups:
             draw.text((x, event_y), "No upcoming events",
-                     font=self.fonts["small"], fill=self._get_color("secondary"))
+                     font=self.fonts["small"], fill=secondary)
             return
 
-        # Group events by date
-        from collections import defaultdict
-        events_by_date = defaultdict(list)
-        for event in self.events:
-            event_date = event.get("start")
-            if event_date:
-                date_key = event_date.strftime("%Y-%m-%d")
-                events_by_date[date_key].append(event)
-
-        # Sort dates
-        sorted_dates = sorted(events_by_date.keys())
-
         # Calculate max title chars
         char_width = 9
         max_title_chars = max(10, (width - 70) // char_width)
 
-        for date_key in sorted_dates:
+        for date_key, date_header, day_events in self.event_groups:
             if event_y > max_y:
                 break
 
-            # Parse date for header
-            date_obj = datetime.strptime(date_key, "%Y-%m-%d")
-            date_header = date_obj.strftime("%A %m.%d").upper()  # "THURSDAY 11.27"
-
             # Draw date header
             draw.text((x, event_y), date_header,
-                     font=self.fonts["small"], fill=self._get_color("warning"))
+                     font=self.fonts["small"], fill=warning)
             event_y += header_height
 
             # Draw events for this date
-            for event in events_by_date[date_key]:
+            for symbol, time_str, title, event_color in day_events:
                 if event_y > max_y:
                     break
 
-                symbol = event.get("symbol", "●")
-                time_str = event.get("time", "")
-                title = event.get("title", "Untitled")
-                color_name = event.get("color", "primary")
-
                 # Truncate title if needed
                 if len(title) > max_title_chars:
                     title = title[:max_title_chars - 2] + ".."
 
-                # Get color for this calendar
-                event_color = self.colors.get(color_name, self._get_color("primary"))
-
                 # Symbol
                 draw.text((x + 5, event_y), symbol, font=self.fonts["small"], fill=event_color)
 
                 # Time
                 draw.text((x + 22, event_y), time_str,
-                         font=self.fonts["small"], fill=self._get_color("secondary"))
+                         font=self.fonts["small"], fill=secondary)
 
                 # Title
                 draw.text((x + 70, event_y), title,
-                         font=self.fonts["small"], fill=self._get_color("primary"))
+                         font=self.fonts["small"], fill=primary)
 
                 event_y += line_height
 
     def render(self, page_index=0, total_pages=1):
         """Render the dashboard page."""
-        image, draw = super().render(page_index, total_pages)
         now = datetime.now()
 
         # Fetch events if needed
         if not self._last_fetch:
             self.refresh_events()
 
+        # Skip the redraw when nothing visible has changed. The clock shows
+        # HH:MM and one arc pixel spans more than two minutes, so the minute
+        # is the finest input that can move anything on screen.
+        state = (now.replace(second=0, microsecond=0), len(self.events),
+                 self._last_fetch, page_index, total_pages)
+        if state == self._last_state and self._last_image is not None:
+            return self._last_image.copy()
+
+        image, draw = super().render(page_index, total_pages)
+
         # Uniform spacing constants
         margin = 15
         gap = 8  # Uniform gap between all boxes
@@ -376,4 +419,6 @@ class DashboardPage(Page):
         # Daylight arc at bottom (no box, no terrain)
         self.draw_daylight_arc(draw, margin, arc_y, self.width - (margin * 2), arc_height, now)
 
+        self._last_state = state
+        self._last_image = image.copy()
         return image
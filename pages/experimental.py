@@ -4,6 +4,7 @@ Ideas: system stats, camera feeds, data visualizations, etc.
 """
 
 from datetime import datetime
+from PIL import Image, ImageDraw
 from pages.base import Page
 import config
 
@@ -18,10 +19,23 @@ class ExperimentalPage(Page):
     def __init__(self, width, height, fonts):
         super().__init__(width, height, fonts)
 
+        # Everything below the header is static, so draw it once up front
+        self._static_body, self._static_offset = self._build_static_body()
+
+    def _build_static_body(self):
+        """Draw the static page content and return (image, offset) for pasting."""
+        body = Image.new("RGB", (self.width, self.height), self.colors["black"])
+        draw = ImageDraw.Draw(body)
+        self.draw_body(draw)
+
+        # Crop to the drawn area so the per-frame paste leaves the header alone
+        bbox = body.getbbox()
+        return body.crop(bbox), bbox[:2]
+
     def draw_placeholder_box(self, draw, x, y, width, height, label):
         """Draw a placeholder box for future content."""
         # Dashed border effect (just corners for now)
-        color = self._get_color("secondary")
+        color = self._c_secondary
 
         # Corner brackets
         bracket_len = 15
@@ -42,18 +56,16 @@ class ExperimentalPage(Page):
         draw.text((x + width // 2 - 40, y + height // 2 - 8), label,
                   font=self.fonts["small"], fill=color)
 
-    def render(self, page_index=0, total_pages=1):
-        """Render the experimental page."""
-        image, draw = super().render(page_index, total_pages)
-
+    def draw_body(self, draw):
+        """Draw the page content below the header."""
         margin = 20
         content_top = 50
 
         # Title
         draw.text((margin, content_top), "EXPERIMENTAL LAB",
-                  font=self.fonts["medium"], fill=self._get_color("accent"))
+                  font=self.fonts["medium"], fill=self._c_accent)
         draw.text((margin, content_top + 28), "実験室 - Future projects go here",
-                  font=self.fonts["small"], fill=self._get_color("secondary"))
+                  font=self.fonts["small"], fill=self._c_secondary)
 
         # Placeholder boxes for future features
         box_width = (self.width - margin * 3) // 2
@@ -74,6 +86,10 @@ class ExperimentalPage(Page):
         # Ideas list at bottom
         ideas_y = self.height - 60
         draw.text((margin, ideas_y), "Ideas: Pi stats, security cam, weather, quotes, pomodoro...",
-                  font=self.fonts["small"], fill=self._get_color("secondary"))
+                  font=self.fonts["small"], fill=self._c_secondary)
 
+    def render(self, page_index=0, total_pages=1):
+        """Render the experimental page."""
+        image, draw = super().render(page_index, total_pages)
+        image.paste(self._static_body, self._static_offset)
         return image
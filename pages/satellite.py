@@ -3,9 +3,17 @@ Satellite Page - Google Earth View imagery with tactical reticle overlay
 Displays curated satellite imagery from around the world
 """
 
+import os
 import re
+import json
+import time
 import random
+import hashlib
+import tempfile
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from datetime import datetime
 from PIL import Image, ImageDraw
 from io import BytesIO
@@ -13,6 +21,9 @@ from io import BytesIO
 from pages.base import Page
 import config
 
+# Coordinates in a Google Maps URL, e.g. .../maps/@45.962714,7.724891,16z/...
+_COORD_RE = re.compile(r'@([-\d.]+),([-\d.]+)')
+
 
 class SatellitePage(Page):
     """Satellite imagery viewer with tactical reticle overlay."""
@@ -31,13 +42,60 @@ class SatellitePage(Page):
         self._last_fetch = None
         self._cached_image = None
         self._cache_index = -1
+        self.list_cache_path = os.path.join(config.CACHE_DIR, "earthview.json")
+        self.image_cache_dir = os.path.join(config.CACHE_DIR, "sat")
+
+        # Shared HTTP session so list and image fetches reuse connections
+        self._session = requests.Session()
+        self._session.headers.update({"User-Agent": "nerv-dashboard/1.0"})
+        self._session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+        # Reticle geometry never changes, so it is drawn once into an overlay
+        self._reticle_cache = None
+        self._reticle_size = None
+
+        # Background prefetch of the upcoming slideshow images (index -> Future),
+        # at most SATELLITE_PREFETCH downloading at once
+        self._prefetch_slots = threading.BoundedSemaphore(config.SATELLITE_PREFETCH)
+        self._prefetched = {}
+
+    def _load_cached_image_list(self):
+        """Load the Earth View list from disk if the cached copy is still fresh."""
+        try:
+            age = time.time() - os.path.getmtime(self.list_cache_path)
+            if age >= config.EARTHVIEW_CACHE_DAYS * 86400:
+                return None
+            with open(self.list_cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_image_list(self, images_data):
+        """Write the Earth View list to disk atomically."""
+        try:
+            os.makedirs(config.CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=config.CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(images_data, f)
+            os.replace(tmp_path, self.list_cache_path)
+        except OSError as e:
+            print(f"Could not cache Earth View list: {e}")
 
     def fetch_image_list(self):
-        """Fetch list of available Earth View images."""
+        """Fetch list of available Earth View images (disk cache first)."""
+        cached = self._load_cached_image_list()
+        if cached:
+            self.images_data = cached
+            random.shuffle(self.images_data)
+            self._last_fetch = datetime.now()
+            print(f"Loaded {len(self.images_data)} Earth View images from cache")
+            return True
+
         try:
-            response = requests.get(self.EARTHVIEW_JSON_URL, timeout=15)
+            response = self._session.get(self.EARTHVIEW_JSON_URL, timeout=15)
             response.raise_for_status()
             self.images_data = response.json()
+            self._save_cached_image_list(self.images_data)
             # Shuffle for variety
             random.shuffle(self.images_data)
             self._last_fetch = datetime.now()
@@ -51,7 +109,7 @@ class SatellitePage(Page):
         """Extract lat/lon from Google Maps URL."""
         try:
             # URL format: https://www.google.com/maps/@45.962714,7.724891,16z/...
-            match = re.search(r'@([-\d.]+),([-\d.]+)', map_url)
+            match = _COORD_RE.search(map_url)
             if match:
                 lat = float(match.group(1))
                 lon = float(match.group(2))
@@ -67,18 +125,192 @@ class SatellitePage(Page):
             if not image_url:
                 return None
 
-            response = requests.get(image_url, timeout=30)
+            response = self._session.get(image_url, timeout=30)
             response.raise_for_status()
 
             image = Image.open(BytesIO(response.content))
+            # Let libjpeg scale down during decode (1/2, 1/4, 1/8) while staying
+            # at least twice the display size for the final LANCZOS pass
+            image.draft("RGB", (self.width * 2, self.height * 2))
+            image.load()
             return image
         except Exception as e:
             print(f"Error fetching Earth View image: {e}")
             return None
 
+    def _fit_to_display(self, sat_img):
+        """Resize and center-crop an image to fill the display."""
+        # Resize to fill display (crop to fit). reduce/resize/crop all return
+        # new images, so the source is never modified and needs no copy.
+        img_ratio = sat_img.width / sat_img.height
+        display_ratio = self.width / self.height
+
+        if img_ratio > display_ratio:
+            # Image is wider - fit height, crop width
+            new_height = self.height
+            new_width = int(new_height * img_ratio)
+        else:
+            # Image is taller - fit width, crop height
+            new_width = self.width
+            new_height = int(new_width / img_ratio)
+
+        # Cheap integer box reduction first when shrinking by 2x or more, so
+        # LANCZOS only has to filter an image close to the target size
+        factor = min(sat_img.width // new_width, sat_img.height // new_height)
+        if factor >= 2:
+            sat_img = sat_img.reduce(factor)
+
+        sat_img = sat_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+
+        # Center crop
+        left = (new_width - self.width) // 2
+        top = (new_height - self.height) // 2
+        sat_img = sat_img.crop((left, top, left + self.width, top + self.height))
+
+        # Convert to RGB if necessary
+        if sat_img.mode != "RGB":
+            sat_img = sat_img.convert("RGB")
+
+        return sat_img
+
+    def _image_cache_path(self, image_url):
+        """Disk cache path for an image URL at the current display size."""
+        key = f"{image_url}|{self.width}x{self.height}"
+        return os.path.join(self.image_cache_dir,
+                            hashlib.sha1(key.encode()).hexdigest() + ".webp")
+
+    def _load_cached_image(self, cache_path):
+        """Load a prepared image from the disk cache, or None on a miss."""
+        try:
+            with Image.open(cache_path) as cached:
+                sat_image = cached.convert("RGB")
+            os.utime(cache_path)  # Mark as recently used for eviction
+            return sat_image
+        except OSError:
+            return None
+
+    def _save_cached_image(self, cache_path, sat_image):
+        """Save a prepared image atomically and evict the least recently used beyond the limit."""
+        tmp_path = None
+        try:
+            os.makedirs(self.image_cache_dir, exist_ok=True)
+            # Write to a temp file first so a concurrent load never sees a partial image
+            fd, tmp_path = tempfile.mkstemp(dir=self.image_cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                sat_image.save(f, "WEBP", quality=85)
+            os.replace(tmp_path, cache_path)
+        except (OSError, KeyError) as e:
+            print(f"Could not cache satellite image: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict_cached_images()
+
+    def _evict_cached_images(self):
+        """Delete the least recently used cached images beyond the limit."""
+        try:
+            names = os.listdir(self.image_cache_dir)
+        except OSError:
+            return
+
+        # Prefetch workers evict concurrently, so files may vanish at any point
+        entries = []
+        for name in names:
+            path = os.path.join(self.image_cache_dir, name)
+            try:
+                if name.endswith(".webp"):
+                    entries.append((os.path.getmtime(path), path))
+                elif name.endswith(".tmp") and os.path.getmtime(path) < time.time() - 600:
+                    os.remove(path)  # Left by a prefetch cut off at process exit
+            except OSError:
+                continue
+        excess = len(entries) - config.SATELLITE_CACHE_MAX_IMAGES
+        if excess <= 0:
+            return
+        entries.sort()
+        for _, path in entries[:excess]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _fetch_and_prepare(self, image_data):
+        """Fetch an image and fit it to the display (safe to run off-thread)."""
+        image_url = image_data.get("image", "")
+        cache_path = self._image_cache_path(image_url) if image_url else None
+        if cache_path:
+            sat_image = self._load_cached_image(cache_path)
+            if sat_image is not None:
+                return sat_image
+
+        sat_image = self.fetch_image(image_data)
+        if sat_image is None:
+            return None
+        sat_image = self._fit_to_display(sat_image)
+        if cache_path:
+            self._save_cached_image(cache_path, sat_image)
+        return sat_image
+
+    def _prefetch(self, start_index):
+        """Fetch the next few images from start_index concurrently in the background."""
+        count = min(config.SATELLITE_PREFETCH, len(self.images_data))
+        window = {(start_index + i) % len(self.images_data) for i in range(count)}
+
+        # Forget prefetches that fell out of the window (e.g. after navigation)
+        for index in list(self._prefetched):
+            if index not in window:
+                self._prefetched.pop(index).cancel()
+
+        for index in window:
+            if index not in self._prefetched and index != self._cache_index:
+                self._prefetched[index] = self._submit_prefetch(self.images_data[index])
+
+    def _submit_prefetch(self, image_data):
+        """Fetch and prepare an image on a daemon thread, returning a Future for it.
+
+        Unlike ThreadPoolExecutor workers, daemon threads don't hold up
+        interpreter exit, so one-shot runs (--once, --page) quit right after
+        their render instead of finishing downloads nobody will see.
+        """
+        future = Future()
+
+        def run():
+            with self._prefetch_slots:
+                # Skip work cancelled while it waited for a slot
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    future.set_result(self._fetch_and_prepare(image_data))
+                except Exception as e:
+                    future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+    def _take_prefetched(self, index, timeout=0.01):
+        """Return the prefetched image for index, waiting at most timeout seconds.
+
+        Returns None if there is no prefetch for index, it is still running,
+        or the fetch failed. A pending prefetch is only removed once it has
+        finished, so a slow download is picked up on a later render. Pass
+        timeout=None to wait for it instead.
+        """
+        future = self._prefetched.get(index)
+        if future is None:
+            return None
+        try:
+            sat_image = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return None
+        except Exception as e:
+            print(f"Error prefetching Earth View image: {e}")
+            sat_image = None
+        del self._prefetched[index]
+        return sat_image
+
     def draw_reticle(self, draw, center_x, center_y, size):
         """Draw tactical reticle overlay with black outline for contrast."""
-        orange = self._get_color("accent")  # Orange/red accent color
+        orange = self._c_accent  # Orange/red accent color
         black = self.colors["black"]  # Black outline for contrast
 
         # Line widths (doubled from original)
@@ -113,19 +345,26 @@ class SatellitePage(Page):
         tick_spacing = 20
         tick_size = 5
 
+        # Ticks never overlap each other, so all outlines go down in one pass
+        # and all orange strokes in a second
+        ticks = []
         for i in range(1, 6):
             offset = gap + (i * tick_spacing)
             if offset < line_length:
                 # Horizontal ticks
-                draw_contrasted_line((center_x - offset, center_y - tick_size),
-                                    (center_x - offset, center_y + tick_size))
-                draw_contrasted_line((center_x + offset, center_y - tick_size),
-                                    (center_x + offset, center_y + tick_size))
+                ticks.append([(center_x - offset, center_y - tick_size),
+                              (center_x - offset, center_y + tick_size)])
+                ticks.append([(center_x + offset, center_y - tick_size),
+                              (center_x + offset, center_y + tick_size)])
                 # Vertical ticks
-                draw_contrasted_line((center_x - tick_size, center_y - offset),
-                                    (center_x + tick_size, center_y - offset))
-                draw_contrasted_line((center_x - tick_size, center_y + offset),
-                                    (center_x + tick_size, center_y + offset))
+                ticks.append([(center_x - tick_size, center_y - offset),
+                              (center_x + tick_size, center_y - offset)])
+                ticks.append([(center_x - tick_size, center_y + offset),
+                              (center_x + tick_size, center_y + offset)])
+        for tick in ticks:
+            draw.line(tick, fill=black, width=main_width + 2)
+        for tick in ticks:
+            draw.line(tick, fill=orange, width=main_width)
 
         # Corner brackets
         bracket_size = 30
@@ -171,9 +410,20 @@ class SatellitePage(Page):
                      center_x + circle_radius, center_y + circle_radius],
                     outline=orange, width=main_width)
 
+    def _reticle_overlay(self, center_x, center_y, size):
+        """Return (overlay, offset) for the reticle, drawing it on first use."""
+        if self._reticle_cache is None or self._reticle_size != size:
+            overlay = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
+            self.draw_reticle(ImageDraw.Draw(overlay), center_x, center_y, size)
+            # Keep only the area the reticle covers to keep the per-frame blit small
+            bbox = overlay.getbbox()
+            self._reticle_cache = (overlay.crop(bbox), bbox[:2])
+            self._reticle_size = size
+        return self._reticle_cache
+
     def draw_data_overlay(self, draw, image_data, x, y):
         """Draw data information overlay in bottom-right, right-aligned."""
-        green = self._get_color("success")  # Green for data
+        green = self._c_success  # Green for data
 
         if not image_data:
             draw.text((x, y), "NO DATA", font=self.fonts["small"], fill=green, anchor="ra")
@@ -239,50 +489,33 @@ class SatellitePage(Page):
         if self.images_data:
             self.current_image_index = self.current_image_index % len(self.images_data)
             current_data = self.images_data[self.current_image_index]
+            shown_index = self.current_image_index
 
-            # Fetch and display satellite image
+            # Display satellite image, preferring the one prefetched last render
             if self._cache_index != self.current_image_index or self._cached_image is None:
-                sat_image = self.fetch_image(current_data)
+                if self._cached_image is not None:
+                    sat_image = self._take_prefetched(self.current_image_index)
+                elif self.current_image_index in self._prefetched:
+                    # Nothing to show yet - wait for the download already running
+                    sat_image = self._take_prefetched(self.current_image_index, timeout=None)
+                else:
+                    # Nothing to show yet - fetch synchronously this once
+                    sat_image = self._fetch_and_prepare(current_data)
                 if sat_image:
                     self._cached_image = sat_image
                     self._cache_index = self.current_image_index
 
             if self._cached_image:
-                # Resize image to fill entire display
-                sat_img = self._cached_image.copy()
-
-                # Resize to fill display (crop to fit)
-                img_ratio = sat_img.width / sat_img.height
-                display_ratio = self.width / self.height
-
-                if img_ratio > display_ratio:
-                    # Image is wider - fit height, crop width
-                    new_height = self.height
-                    new_width = int(new_height * img_ratio)
-                else:
-                    # Image is taller - fit width, crop height
-                    new_width = self.width
-                    new_height = int(new_width / img_ratio)
-
-                sat_img = sat_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-                # Center crop
-                left = (new_width - self.width) // 2
-                top = (new_height - self.height) // 2
-                sat_img = sat_img.crop((left, top, left + self.width, top + self.height))
-
-                # Convert to RGB if necessary
-                if sat_img.mode != "RGB":
-                    sat_img = sat_img.convert("RGB")
-
-                image.paste(sat_img, (0, 0))
-
-                # Need to recreate draw object after paste
-                draw = ImageDraw.Draw(image)
+                image.paste(self._cached_image, (0, 0))
+                # While the next image is still downloading the previous one
+                # stays up, so label the frame with the image actually shown
+                if self._cache_index < len(self.images_data):
+                    shown_index = self._cache_index
+                    current_data = self.images_data[shown_index]
 
         # Draw border box with contrast (25px from edge)
         border_margin = 25
-        orange = self._get_color("accent")
+        orange = self._c_accent
         black = self.colors["black"]
 
         # Draw black outline first, then orange on top
@@ -297,7 +530,8 @@ class SatellitePage(Page):
         center_x = self.width // 2
         center_y = self.height // 2
         reticle_size = min(self.width, self.height) - 100
-        self.draw_reticle(draw, center_x, center_y, reticle_size)
+        reticle, reticle_offset = self._reticle_overlay(center_x, center_y, reticle_size)
+        image.paste(reticle, reticle_offset, reticle)
 
         # Draw data overlay (bottom-right, inside border)
         data_x = self.width - border_margin - 10
@@ -306,18 +540,21 @@ class SatellitePage(Page):
 
         # Draw header elements (minimal, top-left)
         draw.text((border_margin + 10, border_margin + 5), "NERV",
-                  font=self.fonts["medium"], fill=self._get_color("accent"))
+                  font=self.fonts["medium"], fill=self._c_accent)
         draw.text((border_margin + 80, border_margin + 9), "SATELLITE VIEW",
-                  font=self.fonts["small"], fill=self._get_color("primary"))
+                  font=self.fonts["small"], fill=self._c_primary)
 
         # Image counter (top-right)
         if self.images_data:
-            counter_text = f"{self.current_image_index + 1}/{len(self.images_data)}"
+            counter_text = f"{shown_index + 1}/{len(self.images_data)}"
             draw.text((self.width - border_margin - 10, border_margin + 9), counter_text,
-                     font=self.fonts["small"], fill=self._get_color("success"), anchor="ra")
+                     font=self.fonts["small"], fill=self._c_success, anchor="ra")
 
-        # Cycle to next image for slideshow effect
+        # Cycle to next image for slideshow effect, unless the current one is
+        # still downloading in the background
         if self.images_data:
-            self.current_image_index = (self.current_image_index + 1) % len(self.images_data)
+            if self.current_image_index not in self._prefetched:
+                self.current_image_index = (self.current_image_index + 1) % len(self.images_data)
+            self._prefetch(self.current_image_index)
 
         return image
@@ -3,10 +3,23 @@ Todos Page - Notion integration
 Today's tasks, Non-Negotiables, and Goals
 """
 
+import os
+import json
+import time
+import tempfile
+import threading
 from datetime import datetime
+from itertools import islice
+from PIL import Image, ImageDraw
 from pages.base import Page
 import config
 
+# Notion integration is optional; without it the page just shows no tasks
+try:
+    from integrations.notion import get_notion_todos
+except ImportError:
+    get_notion_todos = None
+
 
 class TodosPage(Page):
     """Todo list page with Notion integration, Non-Negotiables, and Goals."""
@@ -16,7 +29,7 @@ class TodosPage(Page):
     title_jp = "タスク一覧"
 
     # Static content
-    NON_NEGOTIABLES = [
+    NON_NEGOTIABLES = (
         "Gym",
         "Meditate",
         "Work",
@@ -24,9 +37,9 @@ class TodosPage(Page):
         "Sunset",
         "Read",
         "Dir.Img",
-    ]
+    )
 
-    GOALS = [
+    GOALS = (
         "Kind, intentional, sympathetic life",
         "$250k/yr",
         "Deep Relationships",
@@ -34,129 +47,359 @@ class TodosPage(Page):
         "Progressive Mental Health",
         "Expansive Spiritual Health",
         "Travel",
-    ]
+    )
+    _GOAL_PREFIXES = tuple(f"{i}." for i in range(1, len(GOALS) + 1))
 
     THEME = "THEME: Intentional, Slow, Present"
 
     def __init__(self, width, height, fonts):
         super().__init__(width, height, fonts)
         self.todos = []
+        self._overdue_count = 0
+        self._overdue_text = None
+        self._todos_version = 0
         self._last_fetch = None
+        self._notion_fingerprint = None  # Open Notion pages as of the last full fetch
+        self._fingerprint_date = None
+
+        # Last rendered frame and the state it was rendered from
+        self._last_state = None
+        self._last_image = None
+
+        self.cache_path = os.path.join(config.CACHE_DIR, "todos.json")
+        self._load_cached_todos()
+
+        # Text widths never change for a given string and font, so measure
+        # each one once; the Non-Negotiables box is sized off its longest item
+        self._text_widths = {}
+        self._nn_box_width = max(self._text_width(item) for item in self.NON_NEGOTIABLES) + 35  # bullet + margins
+
+        # The Non-Negotiables and Goals panels never change; drawn once on first render
+        self._panels = None
+
+        # Refresh in the background; the worker starts on the first render so
+        # processes that never show this page don't talk to Notion
+        self._lock = threading.Lock()
+        self._fail_streak = 0
+        self._paused_until = 0.0  # time.monotonic() the worker sleeps until after failures
+        self._stop = threading.Event()
+        self._wake = threading.Event()  # Cuts the worker's wait short (force_refresh, stop)
+        self._fetched = threading.Event()  # Set after every refresh attempt
+        self._worker = None
+
+    def _start_worker(self):
+        """Start the background refresh worker if it isn't running yet."""
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._refresh_loop, daemon=True)
+            self._worker.start()
+
+    def _refresh_loop(self):
+        """Background worker: fetch todos now, then every NOTION_TTL_SECONDS or when woken."""
+        # Todos restored from the disk cache are good until their TTL runs out
+        delay = 0
+        if self._last_fetch is not None:
+            age = (datetime.now() - self._last_fetch).total_seconds()
+            delay = max(0, config.NOTION_TTL_SECONDS - age)
+        while True:
+            self._wake.wait(delay)
+            if self._stop.is_set():
+                break
+            self._wake.clear()
+            try:
+                self.refresh_todos()
+            except Exception as e:
+                print(f"Error refreshing todos: {e}")
+            self._fetched.set()
+            # After repeated failures, sleep out the back-off pause instead
+            delay = max(config.NOTION_TTL_SECONDS, self._paused_until - time.monotonic())
+
+    def force_refresh(self):
+        """Have the worker re-fetch from Notion now and wait briefly for the result."""
+        self._fetched.clear()
+        self._wake.set()
+        self._start_worker()
+        self._fetched.wait(config.NOTION_FIRST_FETCH_WAIT)
+
+    def stop(self):
+        """Stop the background refresh worker."""
+        self._stop.set()
+        self._wake.set()
+
+    def _load_cached_todos(self):
+        """Restore todos saved by a previous run if they are still within the TTL."""
+        try:
+            if os.path.getmtime(self.cache_path) < datetime.now().timestamp() - config.NOTION_TTL_SECONDS:
+                return
+            with open(self.cache_path) as f:
+                cached = json.load(f)
+            todos = cached["todos"]
+            for todo in todos:
+                if todo.get("due_date"):
+                    todo["due_date"] = datetime.fromisoformat(todo["due_date"])
+            self._set_todos(todos)
+            self._last_fetch = datetime.fromisoformat(cached["ts"])
+            print(f"Loaded {len(self.todos)} todos from cache")
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def _save_cached_todos(self):
+        """Write the current todos to disk atomically."""
+        todos = [dict(todo, due_date=todo["due_date"].isoformat() if todo.get("due_date") else None)
+                 for todo in self.todos]
+        try:
+            os.makedirs(config.CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=config.CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"todos": todos, "ts": self._last_fetch.isoformat()}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Could not cache todos: {e}")
+
+    def _text_width(self, text):
+        """Pixel width of text in the small font, measured once per string."""
+        width = self._text_widths.get(text)
+        if width is None:
+            bbox = self.fonts["small"].getbbox(text)
+            width = self._text_widths[text] = bbox[2] - bbox[0]
+        return width
+
+    def _set_todos(self, todos):
+        """Replace the todo list and its derived counts (caller holds the lock)."""
+        # get_notion_todos already returns overdue items first, so only the
+        # due-date labels and overdue count need deriving here
+        for todo in todos:
+            due_date = todo.get("due_date")
+            todo["_due_str"] = due_date.strftime("%m/%d") if due_date else None
+        if todos != self.todos:
+            self._todos_version += 1
+        self.todos = todos
+        self._overdue_count = sum(1 for t in todos if t.get("is_overdue"))
+        self._overdue_text = f"OVERDUE: {self._overdue_count}" if self._overdue_count else None
 
     def refresh_todos(self):
-        """Fetch fresh todos from Notion."""
+        """Fetch fresh todos from Notion (only the refresh worker calls this)."""
+        if get_notion_todos is None:
+            with self._lock:
+                self._set_todos([])
+            return
+
+        # Overdue flags and the due-today filter depend on the date, so only
+        # let Notion skip the full fetch when the last one was earlier today
+        known = None
+        if self._fingerprint_date == datetime.now().date():
+            known = self._notion_fingerprint
         try:
-            from integrations.notion import get_notion_todos
-            self.todos = get_notion_todos()
-            self._last_fetch = datetime.now()
-            print(f"Fetched {len(self.todos)} todos from Notion")
+            todos, fingerprint = get_notion_todos(known=known)
         except Exception as e:
+            # Keep showing the last todos we had instead of blanking the list
             print(f"Error fetching Notion todos: {e}")
-            self.todos = []
-
-    def draw_checkbox(self, draw, x, y, checked=False, overdue=False, size=14):
-        """Draw a checkbox."""
-        color = self._get_color("accent") if overdue else self._get_color("primary")
-        draw.rectangle([x, y, x + size, y + size], outline=color, width=1)
-        if checked:
-            draw.line([(x + 3, y + size//2), (x + size//2, y + size - 3)], fill=color, width=2)
-            draw.line([(x + size//2, y + size - 3), (x + size - 3, y + 3)], fill=color, width=2)
+            self._fail_streak += 1
+            extra = self._fail_streak - config.NOTION_FAILURES_BEFORE_PAUSE
+            if extra >= 0:
+                # Multiples of the poll interval, so even the first pause skips a poll
+                pause = min(config.NOTION_TTL_SECONDS * 2 ** (extra + 1),
+                            config.NOTION_MAX_PAUSE_SECONDS)
+                self._paused_until = time.monotonic() + pause
+                print(f"Pausing Notion fetches for {pause}s after {self._fail_streak} failures")
+            return
+        self._fail_streak = 0
+        if todos is None:
+            with self._lock:
+                self._last_fetch = datetime.now()
+            print("Notion todos unchanged")
+            return
+        with self._lock:
+            self._set_todos(todos)
+            self._last_fetch = datetime.now()
+            self._notion_fingerprint = fingerprint
+            self._fingerprint_date = self._last_fetch.date()
+        print(f"Fetched {len(todos)} todos from Notion")
+        self._save_cached_todos()
 
     def draw_bullet(self, draw, x, y, color=None):
         """Draw a bullet point."""
         if color is None:
-            color = self._get_color("primary")
+            color = self._c_primary
         draw.ellipse([x, y + 4, x + 6, y + 10], fill=color)
 
-    def draw_todo_item(self, draw, x, y, todo, max_width=280, show_date_width=50):
-        """Draw a single todo item with checkbox, title, and optional due indicator."""
+    def layout_todo_item(self, x, y, todo, max_width=280, show_date_width=50):
+        """Work out what to draw for one todo row, without drawing it.
+
+        Returns (x, y, title, text_color, box_color, done, due), where due is
+        an (x, text) pair for the overdue date indicator or None.
+        """
         title = todo.get("title", "Untitled")
         done = todo.get("done", False)
         is_overdue = todo.get("is_overdue", False)
-        due_date = todo.get("due_date")
-
-        # Checkbox
-        self.draw_checkbox(draw, x, y + 1, done, is_overdue, size=14)
+        due_str = todo.get("_due_str")
+        small = self.fonts["small"]
 
         # Calculate available width for title (leave space for date if overdue)
-        title_start_x = x + 22
-        if is_overdue and due_date:
+        if is_overdue and due_str:
             available_width = max_width - 22 - show_date_width - 10
         else:
             available_width = max_width - 22 - 10
 
-        # Truncate title based on available pixel width
-        char_width = 9  # Approximate char width in small font
-        max_chars = max(10, available_width // char_width)
-        if len(title) > max_chars:
-            title = title[:max_chars - 2] + ".."
+        # Truncate title to the available pixel width, binary searching for
+        # the longest prefix that still fits alongside the ".." suffix
+        if small.getlength(title) > available_width:
+            lo, hi = 0, len(title)
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if small.getlength(title[:mid] + "..") <= available_width:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            title = title[:lo] + ".."
 
         # Color based on state
         if done:
-            text_color = self._get_color("secondary")
+            text_color = self._c_secondary
         elif is_overdue:
-            text_color = self._get_color("accent")
+            text_color = self._c_accent
         else:
-            text_color = self._get_color("primary")
-
-        draw.text((title_start_x, y), title, font=self.fonts["small"], fill=text_color)
+            text_color = self._c_primary
+        box_color = self._c_accent if is_overdue else self._c_primary
 
         # Due date indicator on right side if overdue
-        if is_overdue and due_date:
-            due_str = due_date.strftime("%m/%d")
-            draw.text((x + max_width - show_date_width, y), due_str,
-                     font=self.fonts["small"], fill=self._get_color("accent"))
+        due = None
+        if is_overdue and due_str:
+            due = (x + max_width - show_date_width, due_str)
+
+        return x, y, title, text_color, box_color, done, due
+
+    def draw_todo_items(self, draw, items, size=14):
+        """Draw laid-out todo rows (checkbox, title, due date) in passes grouped by color."""
+        small = self.fonts["small"]
+        boxes, checks, texts = {}, {}, {}
+        for x, y, title, text_color, box_color, done, due in items:
+            boxes.setdefault(box_color, []).append((x, y + 1))
+            if done:
+                checks.setdefault(box_color, []).append((x, y + 1))
+            texts.setdefault(text_color, []).append((x + 22, y, title))
+            if due:
+                texts.setdefault(self._c_accent, []).append((due[0], y, due[1]))
+
+        # Checkbox outlines
+        for color, points in boxes.items():
+            for bx, by in points:
+                draw.rectangle([bx, by, bx + size, by + size], outline=color, width=1)
+
+        # Check marks
+        for color, points in checks.items():
+            for cx, cy in points:
+                draw.line([(cx + 3, cy + size//2), (cx + size//2, cy + size - 3)], fill=color, width=2)
+                draw.line([(cx + size//2, cy + size - 3), (cx + size - 3, cy + 3)], fill=color, width=2)
+
+        # Titles and due dates
+        for color, runs in texts.items():
+            for tx, ty, text in runs:
+                draw.text((tx, ty), text, font=small, fill=color)
 
     def draw_non_negotiables(self, draw, x, y, width, height):
         """Draw the Non-Negotiables box."""
+        small = self.fonts["small"]
+        accent = self._c_accent
+        warning = self._c_warning
+        primary = self._c_primary
+
         # Header
         draw.text((x, y), "必須 / NN",
-                  font=self.fonts["small"], fill=self._get_color("accent"))
+                  font=small, fill=accent)
 
         # Items
         item_y = y + 22
         line_height = 18
 
         for item in self.NON_NEGOTIABLES:
-            self.draw_bullet(draw, x, item_y, self._get_color("warning"))
+            self.draw_bullet(draw, x, item_y, warning)
             draw.text((x + 12, item_y), item,
-                     font=self.fonts["small"], fill=self._get_color("primary"))
+                     font=small, fill=primary)
             item_y += line_height
 
     def draw_goals(self, draw, x, y, width, height):
         """Draw the Goals box."""
+        small = self.fonts["small"]
+        accent = self._c_accent
+        warning = self._c_warning
+        primary = self._c_primary
+
         # Header
         draw.text((x, y), "目標 / GOALS",
-                  font=self.fonts["small"], fill=self._get_color("accent"))
+                  font=small, fill=accent)
 
         # Items
         item_y = y + 22
         line_height = 18
 
-        for i, goal in enumerate(self.GOALS, 1):
+        for prefix, goal in zip(self._GOAL_PREFIXES, self.GOALS):
             # Number prefix
-            draw.text((x, item_y), f"{i}.",
-                     font=self.fonts["small"], fill=self._get_color("warning"))
+            draw.text((x, item_y), prefix,
+                     font=small, fill=warning)
             draw.text((x + 18, item_y), goal,
-                     font=self.fonts["small"], fill=self._get_color("primary"))
+                     font=small, fill=primary)
             item_y += line_height
 
         # Theme at bottom
         item_y += 8
         draw.text((x, item_y), f"*{self.THEME}",
-                 font=self.fonts["small"], fill=self._get_color("success"))
+                 font=small, fill=self._c_success)
+
+    def _build_static_panels(self, margin, bottom_half_y, bottom_height):
+        """Draw the Non-Negotiables and Goals panels and return (image, offset) for pasting."""
+        panels = Image.new("RGB", (self.width, self.height), self.colors["black"])
+        draw = ImageDraw.Draw(panels)
+
+        # Task list box width for alignment reference
+        task_box_right_edge = self.width - margin + 5
+
+        # Non-Negotiables width is based on the longest item (measured once)
+        nn_box_width = self._nn_box_width
+
+        goals_box_x = margin + nn_box_width + 15
+        # Goals box should extend to same right edge as task list box
+        goals_box_width = task_box_right_edge - goals_box_x
+
+        # Non-Negotiables box (left)
+        self.draw_non_negotiables(draw, margin, bottom_half_y, nn_box_width, bottom_height)
+        self.draw_border_frame(draw, margin - 5, bottom_half_y - 5, nn_box_width, bottom_height)
+
+        # Goals box (right) - aligned with task list box
+        self.draw_goals(draw, goals_box_x, bottom_half_y, goals_box_width, bottom_height)
+        self.draw_border_frame(draw, goals_box_x - 5, bottom_half_y - 5, goals_box_width, bottom_height)
+
+        # Crop to the drawn area so the per-frame paste leaves the todo list alone
+        bbox = panels.getbbox()
+        return panels.crop(bbox), bbox[:2]
 
     def render(self, page_index=0, total_pages=1):
         """Render the todos page."""
+        # The background worker keeps todos fresh and render reads a snapshot.
+        # On a cold start with nothing cached, give the first fetch a moment
+        # to land rather than drawing an empty list.
+        self._start_worker()
+        if self._last_fetch is None:
+            self._fetched.wait(config.NOTION_FIRST_FETCH_WAIT)
+        with self._lock:
+            todos = list(self.todos)
+            overdue_text = self._overdue_text
+            version = self._todos_version
+
+        # Nothing on this page depends on the clock, so the frame only needs
+        # redrawing when the todo list is replaced or the page dots move
+        state = (version, page_index, total_pages)
+        if state == self._last_state and self._last_image is not None:
+            return self._last_image.copy()
+
         image, draw = super().render(page_index, total_pages)
 
+        small = self.fonts["small"]
+        accent = self._c_accent
+        secondary = self._c_secondary
+
         margin = 20
         content_top = 35  # Reduced since no hazard stripes
 
-        # Fetch todos if needed (on first render or refresh)
-        if not self._last_fetch:
-            self.refresh_todos()
-
         # Layout: Top ~60% = Todos, Bottom ~40% = Non-Negotiables + Goals side by side
         # Increased top section to fit more tasks
         top_height = int((self.height - content_top - 20) * 0.58)
@@ -166,16 +409,13 @@ class TodosPage(Page):
         # === TOP HALF: TODOS BOX ===
         # Header: "TODAY'S TASKS" on left (small font, matches dashboard date style)
         draw.text((margin, content_top), "TODAY'S TASKS",
-                  font=self.fonts["small"], fill=self._get_color("accent"))
-
-        # Count overdue items - right aligned
-        overdue_count = sum(1 for t in self.todos if t.get("is_overdue"))
-        if overdue_count > 0:
-            overdue_text = f"OVERDUE: {overdue_count}"
-            overdue_bbox = draw.textbbox((0, 0), overdue_text, font=self.fonts["small"])
-            overdue_width = overdue_bbox[2] - overdue_bbox[0]
+                  font=small, fill=accent)
+
+        # Overdue count (computed at fetch time) - right aligned
+        if overdue_text:
+            overdue_width = self._text_width(overdue_text)
             draw.text((self.width - margin - overdue_width - 5, content_top),
-                     overdue_text, font=self.fonts["small"], fill=self._get_color("accent"))
+                     overdue_text, font=small, fill=accent)
 
         # Todo list - start closer to header, tighter line height
         item_y = content_top + 22
@@ -185,48 +425,35 @@ class TodosPage(Page):
 
         todo_box_width = self.width - margin * 2 - 10
 
-        if not self.todos:
+        if not todos:
             draw.text((margin + 22, item_y), "No tasks due today",
-                     font=self.fonts["small"], fill=self._get_color("secondary"))
+                     font=small, fill=secondary)
         else:
-            for i, todo in enumerate(self.todos[:max_items]):
+            rows = []
+            for todo in islice(todos, max_items):
                 if item_y + line_height > max_y:
                     break
-                self.draw_todo_item(draw, margin, item_y, todo, max_width=todo_box_width)
+                rows.append(self.layout_todo_item(margin, item_y, todo, max_width=todo_box_width))
                 item_y += line_height
+            self.draw_todo_items(draw, rows)
 
-            if len(self.todos) > max_items:
-                remaining = len(self.todos) - max_items
+            if len(todos) > max_items:
+                remaining = len(todos) - max_items
                 if item_y + line_height <= max_y:
                     draw.text((margin, item_y),
                              f"+ {remaining} more...",
-                             font=self.fonts["small"], fill=self._get_color("secondary"))
+                             font=small, fill=secondary)
 
         # Todos box border
         self.draw_border_frame(draw, margin - 5, content_top - 5,
                               self.width - margin * 2 + 10, top_height)
 
         # === BOTTOM HALF: NON-NEGOTIABLES + GOALS ===
-        # Task list box width for alignment reference
-        task_box_right_edge = self.width - margin + 5
-
-        # Calculate Non-Negotiables width based on longest item
-        max_nn_width = 0
-        for item in self.NON_NEGOTIABLES:
-            bbox = draw.textbbox((0, 0), item, font=self.fonts["small"])
-            max_nn_width = max(max_nn_width, bbox[2] - bbox[0])
-        nn_box_width = max_nn_width + 35  # Add padding for bullet and margins
-
-        goals_box_x = margin + nn_box_width + 15
-        # Goals box should extend to same right edge as task list box
-        goals_box_width = task_box_right_edge - goals_box_x
-
-        # Non-Negotiables box (left)
-        self.draw_non_negotiables(draw, margin, bottom_half_y, nn_box_width, bottom_height)
-        self.draw_border_frame(draw, margin - 5, bottom_half_y - 5, nn_box_width, bottom_height)
-
-        # Goals box (right) - aligned with task list box
-        self.draw_goals(draw, goals_box_x, bottom_half_y, goals_box_width, bottom_height)
-        self.draw_border_frame(draw, goals_box_x - 5, bottom_half_y - 5, goals_box_width, bottom_height)
+        if self._panels is None:
+            self._panels = self._build_static_panels(margin, bottom_half_y, bottom_height)
+        panels, offset = self._panels
+        image.paste(panels, offset)
 
+        self._last_state = state
+        self._last_image = image.copy()
         return image